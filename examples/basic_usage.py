@@ -78,7 +78,7 @@ def main():
     
     parsed_data = parse(signed_data)
     print("Parsed data structure:")
-    print(json.dumps(parsed_data, indent=2, default=str))
+    print(json.dumps(parsed_data, indent=2))
     print()
     
     # Example 4: Working with individual components
@@ -12,10 +12,10 @@ To run this example:
 4. Open http://localhost:8000/docs to see the API documentation
 """
 
-from fastapi import FastAPI, Depends, HTTPException, Header
+from fastapi import FastAPI, Depends, HTTPException
 from fastapi.responses import JSONResponse
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional
 import uvicorn
 
 # Import the library
@@ -23,7 +23,6 @@ from telegram_init_data import (
     validate,
     parse,
     sign,
-    is_valid,
     TelegramInitDataAuth,
     TelegramInitDataBearer,
     create_init_data_dependency,
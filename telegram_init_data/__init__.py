@@ -5,6 +5,9 @@ A Python library for working with Telegram Mini Apps initialization data.
 Provides utilities to parse, validate, and sign init data on the server side.
 """
 
+import importlib.util
+from typing import Any
+
 from .exceptions import (
     TelegramInitDataError,
     AuthDateInvalidError,
@@ -18,22 +21,39 @@ from .sign_data import sign_data
 from .validate import validate
 from .is_valid import is_valid
 from .parse import parse
+from .validate_and_parse_cached import validate_and_parse_cached
 from .sign import sign
 from .validate3rd import validate3rd
 from .is_valid3rd import is_valid3rd
 
-# FastAPI integration (optional)
-try:
-    from .fastapi import (
-        TelegramInitDataAuth,
-        TelegramInitDataBearer,
-        create_init_data_dependency,
-        create_optional_init_data_dependency,
-        get_telegram_auth,
-    )
-    _fastapi_available = True
-except ImportError:
-    _fastapi_available = False
+# FastAPI integration (optional, imported on first use as importing
+# FastAPI itself is slow)
+_FASTAPI_EXPORTS = (
+    "TelegramInitDataAuth",
+    "TelegramInitDataBearer",
+    "create_init_data_dependency",
+    "create_optional_init_data_dependency",
+    "get_telegram_auth",
+)
+_fastapi_available = importlib.util.find_spec("fastapi") is not None
+
+
+def __getattr__(name: str) -> Any:
+    if name in _FASTAPI_EXPORTS:
+        # Keep hasattr()/getattr() with a default working without FastAPI
+        try:
+            from . import fastapi as _fastapi
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} "
+                f"(install 'telegram-init-data[fastapi]' to use it)"
+            ) from e
+        
+        value = getattr(_fastapi, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = "1.0.0"
 __all__ = [
@@ -54,6 +74,7 @@ __all__ = [
     "validate",
     "is_valid",
     "parse",
+    "validate_and_parse_cached",
     "sign",
     "validate3rd",
     "is_valid3rd",
@@ -61,10 +82,4 @@ __all__ = [
 
 # Add FastAPI components to __all__ if available
 if _fastapi_available:
-    __all__.extend([
-        "TelegramInitDataAuth",
-        "TelegramInitDataBearer",
-        "create_init_data_dependency",
-        "create_optional_init_data_dependency",
-        "get_telegram_auth",
-    ]) 
\ No newline at end of file
+    __all__.extend(_FASTAPI_EXPORTS) 
\ No newline at end of file
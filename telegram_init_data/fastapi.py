@@ -4,13 +4,15 @@ FastAPI integration for Telegram Init Data validation.
 Provides middleware and dependencies for easy integration with FastAPI applications.
 """
 
-from typing import Optional, Dict, Any, Callable
+from typing import Optional, Callable
 from fastapi import HTTPException, Header, Depends
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
-from .validate import validate
-from .parse import parse
-from .is_valid import is_valid
+from .hash_token import hash_token
+from .sign_data import _hmac_prototype
+from .validate import _get_expires_in
+from .validate_and_parse_cached import _validate_and_parse_cached
 from .types import InitData, ValidateOptions
 from .exceptions import TelegramInitDataError
 
@@ -46,6 +48,11 @@ class TelegramInitDataAuth:
         self.scheme_name = scheme_name
         self.auto_error = auto_error
         self.validate_options = validate_options or {}
+        
+        # Derive the HMAC key and resolve options once instead of on every request
+        self._secret_key = hash_token(bot_token)
+        self._hmac_proto = _hmac_prototype(self._secret_key)
+        self._expires_in = _get_expires_in(self.validate_options)
     
     def __call__(self, authorization: Optional[str] = Header(None)) -> InitData:
         """
@@ -86,11 +93,10 @@ class TelegramInitDataAuth:
         init_data_str = authorization[len(expected_prefix):]
         
         try:
-            # Validate init data
-            validate(init_data_str, self.bot_token, self.validate_options)
-            
-            # Parse and return structured data
-            return parse(init_data_str)
+            # Validate and parse init data (cached for repeated requests)
+            return _validate_and_parse_cached(
+                init_data_str, self._secret_key, self._hmac_proto, self._expires_in
+            )
             
         except TelegramInitDataError as e:
             if self.auto_error:
@@ -127,6 +133,11 @@ class TelegramInitDataBearer(HTTPBearer):
         super().__init__(auto_error=auto_error)
         self.bot_token = bot_token
         self.validate_options = validate_options or {}
+        
+        # Derive the HMAC key and resolve options once instead of on every request
+        self._secret_key = hash_token(bot_token)
+        self._hmac_proto = _hmac_prototype(self._secret_key)
+        self._expires_in = _get_expires_in(self.validate_options)
     
     async def __call__(self, credentials: HTTPAuthorizationCredentials = Depends(HTTPBearer(auto_error=False))) -> InitData:
         """
@@ -151,11 +162,16 @@ class TelegramInitDataBearer(HTTPBearer):
             return None
         
         try:
-            # Validate init data
-            validate(credentials.credentials, self.bot_token, self.validate_options)
-            
-            # Parse and return structured data
-            return parse(credentials.credentials)
+            # Validate and parse init data (cached for repeated requests) in
+            # the threadpool, as FastAPI does for the sync dependencies, so
+            # hashing doesn't block the event loop
+            return await run_in_threadpool(
+                _validate_and_parse_cached,
+                credentials.credentials,
+                self._secret_key,
+                self._hmac_proto,
+                self._expires_in,
+            )
             
         except TelegramInitDataError as e:
             if self.auto_error:
@@ -192,6 +208,10 @@ def create_init_data_dependency(
         >>> async def get_user(init_data: InitData = Depends(auth_dependency)):
         ...     return {"user_id": init_data["user"]["id"]}
     """
+    secret_key = hash_token(bot_token)
+    hmac_proto = _hmac_prototype(secret_key)
+    expires_in = _get_expires_in(validate_options)
+    
     def dependency(header_value: Optional[str] = Header(None, alias=header_name)) -> InitData:
         if not header_value:
             if auto_error:
@@ -202,11 +222,10 @@ def create_init_data_dependency(
             return None
         
         try:
-            # Validate init data
-            validate(header_value, bot_token, validate_options)
-            
-            # Parse and return structured data
-            return parse(header_value)
+            # Validate and parse init data (cached for repeated requests)
+            return _validate_and_parse_cached(
+                header_value, secret_key, hmac_proto, expires_in
+            )
             
         except TelegramInitDataError as e:
             if auto_error:
@@ -247,16 +266,19 @@ def create_optional_init_data_dependency(
         ...         return {"user_content": True}
         ...     return {"public_content": True}
     """
+    secret_key = hash_token(bot_token)
+    hmac_proto = _hmac_prototype(secret_key)
+    expires_in = _get_expires_in(validate_options)
+    
     def dependency(header_value: Optional[str] = Header(None, alias=header_name)) -> Optional[InitData]:
         if not header_value:
             return None
         
         try:
-            # Validate init data
-            validate(header_value, bot_token, validate_options)
-            
-            # Parse and return structured data
-            return parse(header_value)
+            # Validate and parse init data (cached for repeated requests)
+            return _validate_and_parse_cached(
+                header_value, secret_key, hmac_proto, expires_in
+            )
             
         except TelegramInitDataError:
             return None
@@ -6,8 +6,15 @@ Contains the hash_token function for generating HMAC keys.
 
 import hmac
 import hashlib
+from typing import Optional, Tuple
+
 from .types import Text
 
+# Last hashed token and its HMAC key. Applications almost always use a single
+# bot token, so one entry is enough. Kept as one tuple so that concurrent
+# callers never see a token paired with another token's key.
+_last_token_hash: Optional[Tuple[Text, bytes]] = None
+
 
 def hash_token(token: Text) -> bytes:
     """
@@ -15,6 +22,7 @@ def hash_token(token: Text) -> bytes:
     
     This function generates a secret key for signing init data
     by computing HMAC-SHA256 of the bot token with 'WebAppData' as key.
+    The result for the most recently used token is cached.
     
     Args:
         token: Bot token to hash (string or bytes)
@@ -26,5 +34,13 @@ def hash_token(token: Text) -> bytes:
         >>> hash_token("bot_token")
         b'\\x1a\\x2b\\x3c...'
     """
+    global _last_token_hash
+    
+    last = _last_token_hash
+    if last is not None and (token is last[0] or token == last[0]):
+        return last[1]
+    
     token_bytes = token.encode('utf-8') if isinstance(token, str) else token
-    return hmac.new(b"WebAppData", token_bytes, hashlib.sha256).digest() 
\ No newline at end of file
+    secret_key = hmac.digest(b"WebAppData", token_bytes, hashlib.sha256)
+    _last_token_hash = (token, secret_key)
+    return secret_key
@@ -5,11 +5,25 @@ Contains the parse function for converting init data string to structured data.
 """
 
 import json
-from urllib.parse import parse_qsl, unquote
-from typing import Dict, Any, Optional
+from urllib.parse import parse_qsl
+from typing import Dict, Any, Optional, Callable
 
 from .types import InitData, User, Chat, ChatType, InitDataInput
 
+# Use orjson for decoding user/chat objects if it's installed (optional)
+_json_loads: Callable[[str], Any]
+try:
+    import orjson
+    
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Optional fields of user and chat objects, by value type
+_USER_STR_FIELDS = ("last_name", "username", "language_code", "photo_url")
+_USER_BOOL_FIELDS = ("is_bot", "is_premium", "added_to_attachment_menu", "allows_write_to_pm")
+_CHAT_STR_FIELDS = ("title", "username", "photo_url")
+
 
 def parse(value: InitDataInput) -> InitData:
     """
@@ -32,36 +46,21 @@ def parse(value: InitDataInput) -> InitData:
     if isinstance(value, dict):
         return _normalize_init_data(value)
     
-    # Parse URL-encoded string
-    parsed_params = dict(parse_qsl(value, strict_parsing=True))
-    
-    # Convert to structured format
+    # Parse URL-encoded string and convert to structured format
     result: InitData = {}
     
-    for key, raw_value in parsed_params.items():
-        if key == "user" and raw_value:
-            result["user"] = _parse_user(raw_value)
-        elif key == "receiver" and raw_value:
-            result["receiver"] = _parse_user(raw_value)
-        elif key == "chat" and raw_value:
-            result["chat"] = _parse_chat(raw_value)
-        elif key == "chat_type" and raw_value:
-            result["chat_type"] = ChatType(raw_value)
-        elif key == "auth_date" and raw_value:
-            result["auth_date"] = int(raw_value)
-        elif key == "can_send_after" and raw_value:
-            result["can_send_after"] = int(raw_value)
-        elif key in ["query_id", "chat_instance", "start_param", "hash", "signature"]:
-            if raw_value:
-                result[key] = raw_value
+    for key, raw_value in parse_qsl(value, strict_parsing=True):
+        field_parser = _FIELD_PARSERS.get(key)
+        if field_parser is not None and raw_value:
+            result[key] = field_parser(raw_value)
     
     return result
 
 
 def _parse_user(user_str: str) -> Optional[User]:
-    """Parse URL-encoded user JSON string."""
+    """Parse user JSON string (already URL-decoded by parse_qsl)."""
     try:
-        user_data = json.loads(unquote(user_str))
+        user_data = _json_loads(user_str)
         if not isinstance(user_data, dict):
             return None
         
@@ -74,15 +73,15 @@ def _parse_user(user_str: str) -> Optional[User]:
             user["first_name"] = str(user_data["first_name"])
         
         # Optional fields
-        optional_str_fields = ["last_name", "username", "language_code", "photo_url"]
-        for field in optional_str_fields:
-            if field in user_data and user_data[field] is not None:
-                user[field] = str(user_data[field])
+        for field in _USER_STR_FIELDS:
+            field_value = user_data.get(field)
+            if field_value is not None:
+                user[field] = str(field_value)
         
-        optional_bool_fields = ["is_bot", "is_premium", "added_to_attachment_menu", "allows_write_to_pm"]
-        for field in optional_bool_fields:
-            if field in user_data and user_data[field] is not None:
-                user[field] = bool(user_data[field])
+        for field in _USER_BOOL_FIELDS:
+            field_value = user_data.get(field)
+            if field_value is not None:
+                user[field] = bool(field_value)
         
         return user
     except (json.JSONDecodeError, ValueError, TypeError):
@@ -90,9 +89,9 @@ def _parse_user(user_str: str) -> Optional[User]:
 
 
 def _parse_chat(chat_str: str) -> Optional[Chat]:
-    """Parse URL-encoded chat JSON string."""
+    """Parse chat JSON string (already URL-decoded by parse_qsl)."""
     try:
-        chat_data = json.loads(unquote(chat_str))
+        chat_data = _json_loads(chat_str)
         if not isinstance(chat_data, dict):
             return None
         
@@ -105,10 +104,10 @@ def _parse_chat(chat_str: str) -> Optional[Chat]:
             chat["type"] = ChatType(chat_data["type"])
         
         # Optional fields
-        optional_str_fields = ["title", "username", "photo_url"]
-        for field in optional_str_fields:
-            if field in chat_data and chat_data[field] is not None:
-                chat[field] = str(chat_data[field])
+        for field in _CHAT_STR_FIELDS:
+            field_value = chat_data.get(field)
+            if field_value is not None:
+                chat[field] = str(field_value)
         
         return chat
     except (json.JSONDecodeError, ValueError, TypeError):
@@ -136,4 +135,20 @@ def _normalize_init_data(data: Dict[str, Any]) -> InitData:
             if value is not None:
                 result[key] = str(value)
     
-    return result 
\ No newline at end of file
+    return result
+
+
+# Converters for known init data fields, keyed by parameter name
+_FIELD_PARSERS: Dict[str, Callable[[str], Any]] = {
+    "user": _parse_user,
+    "receiver": _parse_user,
+    "chat": _parse_chat,
+    "chat_type": ChatType,
+    "auth_date": int,
+    "can_send_after": int,
+    "query_id": str,
+    "chat_instance": str,
+    "start_param": str,
+    "hash": str,
+    "signature": str,
+}
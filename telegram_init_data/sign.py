@@ -6,16 +6,16 @@ Contains the sign function for creating signed init data.
 
 from datetime import datetime
 from urllib.parse import urlencode
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Union
 
 from .types import SignData, Text, ValidateOptions
-from .sign_data import sign_data
+from .sign_data import sign_data, _build_check_string
 
 
 def sign(
     data: SignData,
     token: Text,
-    auth_date: datetime,
+    auth_date: Union[datetime, int],
     options: ValidateOptions = None
 ) -> str:
     """
@@ -27,7 +27,7 @@ def sign(
     Args:
         data: Init data to sign (dict)
         token: Bot token for signing
-        auth_date: Authentication date
+        auth_date: Authentication date (datetime or Unix timestamp)
         options: Additional options (currently unused)
         
     Returns:
@@ -40,7 +40,10 @@ def sign(
         'auth_date=1234567890&query_id=123&user=%7B%22id%22%3A1%2C%22first_name%22%3A%22John%22%7D&hash=abc123'
     """
     # Convert datetime to timestamp
-    auth_date_timestamp = int(auth_date.timestamp())
+    if isinstance(auth_date, datetime):
+        auth_date_timestamp = int(auth_date.timestamp())
+    else:
+        auth_date_timestamp = int(auth_date)
     
     # Create a copy of data and add auth_date
     sign_data_dict = dict(data)
@@ -54,8 +57,7 @@ def sign(
     params = _serialize_init_data(sign_data_dict)
     
     # Create check string from sorted parameters
-    pairs = [f"{key}={value}" for key, value in sorted(params.items())]
-    check_string = "\n".join(pairs)
+    check_string = _build_check_string(params)
     
     # Calculate signature
     signature = sign_data(check_string, token, options)
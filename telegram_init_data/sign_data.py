@@ -6,9 +6,14 @@ Contains the sign_data function for creating HMAC-SHA256 signatures.
 
 import hmac
 import hashlib
+from typing import Any, Mapping, Optional, Tuple
+
 from .types import Text, ValidateOptions
 from .hash_token import hash_token
 
+# Pre-keyed HMAC of the most recently used token (see hash_token)
+_last_token_hmac: Optional[Tuple[Text, "hmac.HMAC"]] = None
+
 
 def sign_data(data: Text, token: Text, options: ValidateOptions = None) -> str:
     """
@@ -32,11 +37,44 @@ def sign_data(data: Text, token: Text, options: ValidateOptions = None) -> str:
     # Convert data to bytes if needed
     data_bytes = data.encode('utf-8') if isinstance(data, str) else data
     
-    # Hash the token to get the secret key
-    secret_key = hash_token(token)
-    
-    # Create HMAC-SHA256 signature
-    signature = hmac.new(secret_key, data_bytes, hashlib.sha256)
+    # Create HMAC-SHA256 signature from the token's pre-keyed HMAC
+    signature = _token_hmac_prototype(token).copy()
+    signature.update(data_bytes)
     
     # Return hex digest
-    return signature.hexdigest() 
\ No newline at end of file
+    return signature.hexdigest()
+
+
+def _build_check_string(data: Mapping[str, Any]) -> bytes:
+    """
+    Build the data-check-string signed by Telegram.
+    
+    Pairs are sorted by key, formatted as "key=value" and joined with
+    newlines in a single pass, then encoded once for hashing.
+    """
+    return "\n".join(
+        [f"{key}={value}" for key, value in sorted(data.items())]
+    ).encode('utf-8')
+
+
+def _hmac_prototype(secret_key: bytes) -> "hmac.HMAC":
+    """
+    Create an HMAC-SHA256 object keyed with secret_key.
+    
+    The returned object is never updated itself; callers sign each message
+    on a copy() of it, which skips re-deriving the HMAC pads from the key.
+    """
+    return hmac.new(secret_key, digestmod=hashlib.sha256)
+
+
+def _token_hmac_prototype(token: Text) -> "hmac.HMAC":
+    """Return the HMAC prototype for token, cached for the last used token."""
+    global _last_token_hmac
+    
+    last = _last_token_hmac
+    if last is not None and (token is last[0] or token == last[0]):
+        return last[1]
+    
+    hmac_proto = _hmac_prototype(hash_token(token))
+    _last_token_hmac = (token, hmac_proto)
+    return hmac_proto
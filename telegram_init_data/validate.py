@@ -4,19 +4,34 @@ Init data validation functionality.
 Contains the validate function for verifying Telegram Mini App init data.
 """
 
+import hmac
+import re
 import time
 from datetime import datetime
 from urllib.parse import parse_qsl
-from typing import Dict, Any
+from typing import Any, Dict, Mapping, Optional
 
 from .types import ValidateValue, ValidateOptions, Text
 from .exceptions import (
+    TelegramInitDataError,
     SignatureMissingError,
     AuthDateInvalidError,
     ExpiredError,
     SignatureInvalidError,
 )
-from .sign_data import sign_data
+from .sign_data import _build_check_string, _token_hmac_prototype
+
+# Default expiration time of init data in seconds (24 hours)
+DEFAULT_EXPIRES_IN = 86400
+
+# Maximum accepted length of an init data string. Real init data is well
+# below 1 KB; longer input is rejected before any parsing or hashing.
+MAX_INIT_DATA_LENGTH = 4096
+
+# Syntax of init data strings: "key=value" pairs separated by "&". Values
+# can't contain "&", so matching never backtracks across pairs and runs in
+# linear time even on adversarial input.
+_INIT_DATA_RE = re.compile(r"[A-Za-z0-9_]+=[^&]*(?:&[A-Za-z0-9_]+=[^&]*)*")
 
 
 def validate(
@@ -45,9 +60,44 @@ def validate(
         >>> validate("query_id=123&user=%7B%22id%22%3A1%7D&auth_date=1234567890&hash=abc123", "bot_token")
         # Raises exception if validation fails, otherwise returns None
     """
-    if options is None:
-        options = {}
+    # Reject malformed strings before deriving the token's HMAC key
+    if isinstance(value, str):
+        _check_structure(value)
+    _validate_checked(value, _token_hmac_prototype(token), _get_expires_in(options))
+
+
+def _validate(value: ValidateValue, hmac_proto: "hmac.HMAC", expires_in: int) -> None:
+    """
+    Validate init data against a pre-keyed HMAC (see _hmac_prototype).
     
+    Takes the already resolved expires_in instead of options, so callers
+    with fixed options (FastAPI dependencies) resolve them only once.
+    """
+    if isinstance(value, str):
+        _check_structure(value)
+    _validate_checked(value, hmac_proto, expires_in)
+
+
+def _check_structure(value: str) -> None:
+    """Cheap structural checks of an init data string, before parsing and hashing."""
+    if len(value) > MAX_INIT_DATA_LENGTH:
+        raise TelegramInitDataError(
+            f"Init data is too long: {len(value)} > {MAX_INIT_DATA_LENGTH}"
+        )
+    if "hash=" not in value:
+        raise SignatureMissingError(third_party=False)
+    if "auth_date=" not in value:
+        raise AuthDateInvalidError()
+    if not _INIT_DATA_RE.fullmatch(value):
+        raise TelegramInitDataError("Init data is malformed")
+
+
+def _validate_checked(
+    value: ValidateValue,
+    hmac_proto: "hmac.HMAC",
+    expires_in: int
+) -> None:
+    """Validate init data that already passed _check_structure (if a string)."""
     # Parse init data if it's a string
     if isinstance(value, str):
         init_data_dict = dict(parse_qsl(value, strict_parsing=True))
@@ -65,30 +115,46 @@ def validate(
         raise AuthDateInvalidError(auth_date_str)
     
     auth_date = int(auth_date_str)
-    auth_date_datetime = datetime.fromtimestamp(auth_date)
     
     # Check expiration
-    expires_in = options.get("expires_in", 86400)  # Default 24 hours
+    _check_expiration(auth_date, expires_in)
+    
+    # Create check string from sorted key-value pairs
+    check_string = _build_check_string(init_data_dict)
+    
+    # Decode received hash to raw bytes, it must be a hex SHA-256 digest
+    if not isinstance(received_hash, str) or len(received_hash) != 64:
+        raise SignatureInvalidError(f"Invalid signature: {received_hash}")
+    try:
+        received_digest = bytes.fromhex(received_hash)
+    except ValueError:
+        raise SignatureInvalidError(f"Invalid signature: {received_hash}")
+    
+    # Calculate expected hash
+    signature = hmac_proto.copy()
+    signature.update(check_string)
+    
+    # Verify signature in constant time
+    if not hmac.compare_digest(signature.digest(), received_digest):
+        raise SignatureInvalidError(f"Invalid signature: {received_hash}")
+
+
+def _get_expires_in(options: Optional[Mapping[str, Any]] = None) -> int:
+    """Get expiration time in seconds from validation options."""
+    if options is None:
+        return DEFAULT_EXPIRES_IN
+    return int(options.get("expires_in", DEFAULT_EXPIRES_IN))
+
+
+def _check_expiration(auth_date: int, expires_in: int) -> None:
+    """Raise ExpiredError if auth_date is older than expires_in seconds."""
     if expires_in > 0:
         now_ts = int(time.time())
         expires_at_ts = auth_date + expires_in
         
         if expires_at_ts < now_ts:
             raise ExpiredError(
-                issued_at=auth_date_datetime,
+                issued_at=datetime.fromtimestamp(auth_date),
                 expires_at=datetime.fromtimestamp(expires_at_ts),
                 now=datetime.fromtimestamp(now_ts)
             )
-    
-    # Create check string from sorted key-value pairs
-    pairs = [f"{key}={value}" for key, value in sorted(init_data_dict.items())]
-    check_string = "\n".join(pairs)
-    
-    # Calculate expected hash
-    expected_hash = sign_data(check_string, token)
-    
-    # Verify signature
-    if expected_hash != received_hash:
-        raise SignatureInvalidError(
-            f"Invalid signature. Expected: {expected_hash}, received: {received_hash}"
-        ) 
\ No newline at end of file
@@ -4,8 +4,6 @@
 Contains functions for validating init data using bot ID instead of token.
 """
 
-import time
-from datetime import datetime
 from urllib.parse import parse_qsl
 from typing import Dict, Any, Union, Callable
 
@@ -13,9 +11,9 @@ from .types import ValidateValue, Validate3rdOptions
 from .exceptions import (
     SignatureMissingError,
     AuthDateInvalidError,
-    ExpiredError,
     SignatureInvalidError,
 )
+from .validate import _check_expiration, _get_expires_in
 
 
 def validate3rd(
@@ -71,20 +69,9 @@ def validate3rd(
         raise AuthDateInvalidError(auth_date_str)
     
     auth_date = int(auth_date_str)
-    auth_date_datetime = datetime.fromtimestamp(auth_date)
     
     # Check expiration
-    expires_in = options.get("expires_in", 86400)  # Default 24 hours
-    if expires_in > 0:
-        now_ts = int(time.time())
-        expires_at_ts = auth_date + expires_in
-        
-        if expires_at_ts < now_ts:
-            raise ExpiredError(
-                issued_at=auth_date_datetime,
-                expires_at=datetime.fromtimestamp(expires_at_ts),
-                now=datetime.fromtimestamp(now_ts)
-            )
+    _check_expiration(auth_date, _get_expires_in(options))
     
     # Create verification string
     pairs = [f"{key}={value}" for key, value in sorted(init_data_dict.items())]
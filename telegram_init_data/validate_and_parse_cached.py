@@ -0,0 +1,109 @@
+"""
+Cached init data validation and parsing.
+
+Contains the validate_and_parse_cached function for skipping repeated
+signature checks when clients resend the same init data.
+"""
+
+import hashlib
+import hmac
+import threading
+from collections import OrderedDict
+from typing import Optional, cast
+
+from .types import InitData, ValidateValue, ValidateOptions, Text
+from .hash_token import hash_token
+from .sign_data import _token_hmac_prototype
+from .validate import _validate, _check_expiration, _get_expires_in
+from .parse import parse
+
+# Maximum number of validated init data entries kept in memory
+CACHE_MAX_SIZE = 10_000
+
+_cache: "OrderedDict[bytes, InitData]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def validate_and_parse_cached(
+    value: ValidateValue,
+    token: Text,
+    options: Optional[ValidateOptions] = None
+) -> InitData:
+    """
+    Validate and parse Telegram Mini App init data, caching the result.
+
+    Mini Apps usually send the same init data with every request until it
+    expires. Successfully validated init data strings are remembered, so
+    repeated calls skip the signature check and parsing; only the
+    expiration is checked again.
+
+    Cache keys are keyed BLAKE2b digests of the init data, using the hashed
+    bot token as the key, so entries are never shared between bot tokens.
+
+    Args:
+        value: Init data to validate (string or dict, dicts are not cached)
+        token: Bot token for signature verification
+        options: Validation options (expires_in, etc.)
+
+    Returns:
+        InitData: Parsed and validated init data
+
+    Raises:
+        SignatureMissingError: When hash parameter is missing
+        AuthDateInvalidError: When auth_date is invalid or missing
+        ExpiredError: When init data has expired
+        SignatureInvalidError: When signature verification fails
+
+    Example:
+        >>> validate_and_parse_cached("query_id=123&auth_date=1234567890&hash=abc123", "bot_token")
+        {'query_id': '123', 'auth_date': 1234567890, 'hash': 'abc123'}
+    """
+    return _validate_and_parse_cached(
+        value,
+        hash_token(token),
+        _token_hmac_prototype(token),
+        _get_expires_in(options),
+    )
+
+
+def _validate_and_parse_cached(
+    value: ValidateValue,
+    secret_key: bytes,
+    hmac_proto: "hmac.HMAC",
+    expires_in: int
+) -> InitData:
+    """Cached validation and parsing with precomputed key, HMAC and expires_in."""
+    if not isinstance(value, str):
+        _validate(value, hmac_proto, expires_in)
+        return parse(value)
+
+    cache_key = hashlib.blake2b(
+        value.encode("utf-8"), key=secret_key, digest_size=16
+    ).digest()
+
+    with _cache_lock:
+        cached = _cache.get(cache_key)
+        if cached is not None:
+            _cache.move_to_end(cache_key)
+
+    if cached is None:
+        _validate(value, hmac_proto, expires_in)
+        cached = parse(value)
+
+        with _cache_lock:
+            _cache[cache_key] = cached
+            if len(_cache) > CACHE_MAX_SIZE:
+                _cache.popitem(last=False)
+    else:
+        # Signature is already verified, only expiration may have changed
+        _check_expiration(cached["auth_date"], expires_in)
+
+    return _copy_init_data(cached)
+
+
+def _copy_init_data(data: InitData) -> InitData:
+    """Copy cached init data so callers can't modify the cache entry."""
+    return cast(InitData, dict(
+        (key, dict(value) if isinstance(value, dict) else value)
+        for key, value in data.items()
+    ))
@@ -4,7 +4,9 @@ Tests for telegram_init_data library.
 Contains comprehensive tests for all functions and edge cases.
 """
 
+import importlib
 import pytest
+import sys
 import time
 from datetime import datetime, timedelta
 from unittest.mock import Mock
@@ -18,6 +20,7 @@ from telegram_init_data import (
     sign,
     validate3rd,
     is_valid3rd,
+    validate_and_parse_cached,
     TelegramInitDataError,
     AuthDateInvalidError,
     SignatureInvalidError,
@@ -53,6 +56,15 @@ class TestHashToken:
         result1 = hash_token(token)
         result2 = hash_token(token)
         assert result1 == result2
+    
+    def test_hash_token_alternating_tokens(self):
+        """Test that switching tokens doesn't return a stale hash."""
+        first = hash_token("first_token")
+        second = hash_token("second_token")
+        
+        assert first != second
+        assert hash_token("first_token") == first
+        assert hash_token(b"second_token") == second
 
 
 class TestSignData:
@@ -115,6 +127,37 @@ class TestValidate:
         with pytest.raises(SignatureMissingError):
             validate(data, self.token)
     
+    def test_validate_malformed_data(self):
+        """Test validation with data that isn't init data at all."""
+        with pytest.raises(SignatureMissingError):
+            validate("invalid_init_data", self.token)
+    
+    def test_validate_malformed_data_skips_key_derivation(self, monkeypatch):
+        """Test that malformed data is rejected before deriving the HMAC key."""
+        validate_module = importlib.import_module("telegram_init_data.validate")
+        
+        def fail(token):
+            raise AssertionError("HMAC key derived for malformed data")
+        
+        monkeypatch.setattr(validate_module, "_token_hmac_prototype", fail)
+        with pytest.raises(TelegramInitDataError):
+            validate("invalid_init_data", "uncached_token")
+        with pytest.raises(TelegramInitDataError):
+            validate(f"auth_date={self.current_time}&&hash=abc123", "uncached_token")
+    
+    def test_validate_invalid_syntax(self):
+        """Test validation with data that isn't a list of key=value pairs."""
+        data = f"auth_date={self.current_time}&&query_id=test_query&hash=abc123"
+        with pytest.raises(TelegramInitDataError):
+            validate(data, self.token)
+        assert is_valid(data, self.token) is False
+    
+    def test_validate_too_long(self):
+        """Test validation with overly long data."""
+        data = self.valid_init_data + "&start_param=" + "a" * 5000
+        with pytest.raises(TelegramInitDataError):
+            validate(data, self.token)
+    
     def test_validate_invalid_auth_date(self):
         """Test validation with invalid auth_date."""
         data = "auth_date=invalid&query_id=test_query&hash=abc123"
@@ -140,6 +183,21 @@ class TestValidate:
         with pytest.raises(SignatureInvalidError):
             validate(data, self.token)
     
+    def test_validate_non_string_hash(self):
+        """Test validation of dict input with a non-string hash."""
+        data = {"auth_date": str(self.current_time), "hash": 123}
+        with pytest.raises(SignatureInvalidError):
+            validate(data, self.token)
+    
+    def test_validate_invalid_signature_hides_expected(self):
+        """Test that the expected signature is not leaked in the error."""
+        expected = sign_data(f"auth_date={self.current_time}\nquery_id=test_query", self.token)
+        data = f"auth_date={self.current_time}&query_id=test_query&hash={'0' * 64}"
+        with pytest.raises(SignatureInvalidError) as exc_info:
+            validate(data, self.token)
+        
+        assert expected not in str(exc_info.value)
+    
     def test_validate_custom_expires_in(self):
         """Test validation with custom expiration time."""
         old_time = self.current_time - 3600  # 1 hour ago
@@ -185,6 +243,23 @@ class TestIsValid:
         data = "auth_date=invalid&query_id=test_query&hash=abc123"
         assert is_valid(data, "test_token") is False
     
+    def test_is_valid_checks_structure_once(self, monkeypatch):
+        """Test that init data structure is checked only once."""
+        validate_module = importlib.import_module("telegram_init_data.validate")
+        calls = []
+        original = validate_module._check_structure
+        
+        def counting_check(value):
+            calls.append(value)
+            return original(value)
+        
+        monkeypatch.setattr(validate_module, "_check_structure", counting_check)
+        current_time = int(time.time())
+        signature = sign_data(f"auth_date={current_time}", "test_token")
+        
+        assert is_valid(f"auth_date={current_time}&hash={signature}", "test_token") is True
+        assert len(calls) == 1
+    
     def test_is_valid_exception_handling(self):
         """Test that is_valid handles all exceptions properly."""
         # Missing hash
@@ -196,6 +271,9 @@ class TestIsValid:
         # Expired data
         old_time = int(time.time()) - 86401
         assert is_valid(f"auth_date={old_time}&hash=abc", "token") is False
+        
+        # Malformed data
+        assert is_valid("invalid_init_data", "token") is False
 
 
 class TestParse:
@@ -248,6 +326,14 @@ class TestParse:
         assert result["user"]["id"] == 123
         assert result["user"]["first_name"] == "John"
     
+    def test_parse_percent_sign_in_user(self):
+        """Test that user fields are URL-decoded only once."""
+        data = {"user": {"id": 123, "first_name": "100%41"}}
+        signed_data = sign(data, "test_token", datetime.now())
+        result = parse(signed_data)
+        
+        assert result["user"]["first_name"] == "100%41"
+    
     def test_parse_invalid_json(self):
         """Test parsing with invalid JSON in user field."""
         data = "user=invalid_json&auth_date=1234567890&hash=abc123"
@@ -285,6 +371,17 @@ class TestSign:
         validate(signed_data, token)
         assert is_valid(signed_data, token) is True
     
+    def test_sign_timestamp_auth_date(self):
+        """Test signing with Unix timestamp as auth_date."""
+        data = {"query_id": "test"}
+        auth_date = datetime.now()
+        token = "test_token"
+        
+        signed_data = sign(data, token, int(auth_date.timestamp()))
+        
+        assert signed_data == sign(data, token, auth_date)
+        assert is_valid(signed_data, token) is True
+    
     def test_sign_removes_existing_hash(self):
         """Test that existing hash is removed when signing."""
         data = {"query_id": "test", "hash": "old_hash"}
@@ -298,6 +395,109 @@ class TestSign:
         assert "hash=" in signed_data
 
 
+class TestValidateAndParseCached:
+    """Tests for validate_and_parse_cached function."""
+    
+    def setup_method(self):
+        """Setup test data."""
+        self.token = "cached_test_token"
+        self.current_time = int(time.time())
+        self.auth_date = datetime.fromtimestamp(self.current_time - 60)
+        data = {"query_id": "test", "user": {"id": 123, "first_name": "John"}}
+        self.signed_data = sign(data, self.token, self.auth_date)
+        
+        # Module is shadowed by the function of the same name in the package
+        self.cache_module = importlib.import_module(
+            "telegram_init_data.validate_and_parse_cached"
+        )
+        self.cache_module._cache.clear()
+    
+    def _count_calls(self, monkeypatch, name):
+        """Replace a function of the cache module with a counting wrapper."""
+        calls = []
+        original = getattr(self.cache_module, name)
+        
+        def wrapper(*args, **kwargs):
+            calls.append(args)
+            return original(*args, **kwargs)
+        
+        monkeypatch.setattr(self.cache_module, name, wrapper)
+        return calls
+    
+    def test_returns_parsed_data(self):
+        """Test that valid data is validated and parsed."""
+        result = validate_and_parse_cached(self.signed_data, self.token)
+        
+        assert result == parse(self.signed_data)
+        assert result["user"]["id"] == 123
+    
+    def test_repeated_calls(self, monkeypatch):
+        """Test that repeated calls skip validation and parsing."""
+        validate_calls = self._count_calls(monkeypatch, "_validate")
+        parse_calls = self._count_calls(monkeypatch, "parse")
+        
+        first = validate_and_parse_cached(self.signed_data, self.token)
+        second = validate_and_parse_cached(self.signed_data, self.token)
+        
+        assert first == second
+        assert len(validate_calls) == 1
+        assert len(parse_calls) == 1
+    
+    def test_cache_eviction(self, monkeypatch):
+        """Test that the least recently used entry is evicted."""
+        monkeypatch.setattr(self.cache_module, "CACHE_MAX_SIZE", 2)
+        signed = [
+            sign({"query_id": f"query_{i}"}, self.token, self.auth_date)
+            for i in range(3)
+        ]
+        for signed_data in signed:
+            validate_and_parse_cached(signed_data, self.token)
+        assert len(self.cache_module._cache) == 2
+        
+        validate_calls = self._count_calls(monkeypatch, "_validate")
+        
+        # Oldest entry was evicted, newest is still cached
+        validate_and_parse_cached(signed[0], self.token)
+        assert len(validate_calls) == 1
+        validate_and_parse_cached(signed[2], self.token)
+        assert len(validate_calls) == 1
+    
+    def test_cached_result_is_copied(self):
+        """Test that modifying the result doesn't affect the cache."""
+        first = validate_and_parse_cached(self.signed_data, self.token)
+        first["user"]["id"] = 456
+        first["query_id"] = "modified"
+        
+        second = validate_and_parse_cached(self.signed_data, self.token)
+        assert second["user"]["id"] == 123
+        assert second["query_id"] == "test"
+    
+    def test_cache_is_isolated_by_token(self):
+        """Test that cached data is not valid for another token."""
+        validate_and_parse_cached(self.signed_data, self.token)
+        
+        with pytest.raises(SignatureInvalidError):
+            validate_and_parse_cached(self.signed_data, "other_token")
+    
+    def test_expiration_checked_on_cache_hit(self, monkeypatch):
+        """Test that expiration is checked for cached data."""
+        validate_calls = self._count_calls(monkeypatch, "_validate")
+        validate_and_parse_cached(self.signed_data, self.token)
+        
+        with pytest.raises(ExpiredError):
+            validate_and_parse_cached(self.signed_data, self.token, {"expires_in": 30})
+        assert len(validate_calls) == 1
+    
+    def test_invalid_data(self):
+        """Test that invalid data raises and is not cached."""
+        data = f"auth_date={self.current_time}&query_id=test&hash=invalid_signature"
+        
+        with pytest.raises(SignatureInvalidError):
+            validate_and_parse_cached(data, self.token)
+        with pytest.raises(SignatureInvalidError):
+            validate_and_parse_cached(data, self.token)
+
+
 class TestValidate3rd:
     """Tests for validate3rd function."""
     
@@ -384,6 +584,23 @@ class TestIsValid3rd:
         assert is_valid3rd("auth_date=invalid&signature=abc", 123456, mock_verify) is False
 
 
+class TestFastAPIImport:
+    """Tests for lazy import of the FastAPI integration."""
+    
+    def test_missing_fastapi(self, monkeypatch):
+        """Test that FastAPI components are missing attributes without FastAPI."""
+        package = importlib.import_module("telegram_init_data")
+        monkeypatch.setitem(sys.modules, "fastapi", None)
+        monkeypatch.delitem(sys.modules, "telegram_init_data.fastapi", raising=False)
+        monkeypatch.delattr(package, "fastapi", raising=False)
+        monkeypatch.delattr(package, "TelegramInitDataAuth", raising=False)
+        
+        assert not hasattr(package, "TelegramInitDataAuth")
+        assert getattr(package, "TelegramInitDataAuth", None) is None
+        with pytest.raises(AttributeError):
+            package.TelegramInitDataAuth
+
+
 class TestExceptions:
     """Tests for exception classes."""
     